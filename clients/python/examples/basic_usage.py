@@ -2,13 +2,15 @@
 Basic Usage Example for Vector Database Python Client
 """
 
-import random
+import numpy as np
 from vector_db import VectorDBClient
 
+_rng = np.random.default_rng()
+
 
 def generate_random_vector(dim=768):
-    """Generate a random vector for testing"""
-    return [random.random() for _ in range(dim)]
+    """Generate a random float32 vector for testing"""
+    return _rng.random(dim, dtype=np.float32)
 
 
 def main():
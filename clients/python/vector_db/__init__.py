@@ -4,7 +4,28 @@ Vector Database Python Client
 A Python client library for the Vector Database with HNSW and NSG indexing.
 """
 
-from .client import VectorDBClient, SearchResult
+import os
+import warnings
+
+# Pick the native protobuf backend (upb in protobuf>=4, C++ in older
+# installs) before any generated vector_pb2 module is imported — the
+# pure-Python backend is orders of magnitude slower at (de)serializing
+# vector-heavy messages like SearchResponse. Must run before the first
+# google.protobuf import anywhere in the process to take effect.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+from google.protobuf.internal import api_implementation
+
+if api_implementation.Type() not in ("cpp", "upb"):
+    warnings.warn(
+        "protobuf is using its pure-Python backend; vector serialization "
+        "will be slow. Install protobuf>=4.21 (upb) or the C++ extension.",
+        RuntimeWarning,
+    )
+
+from .types import SearchResult
+from .client import VectorDBClient
+from .aio import AsyncVectorDBClient
 
 __version__ = "1.1.0"
-__all__ = ["VectorDBClient", "SearchResult"]
+__all__ = ["VectorDBClient", "AsyncVectorDBClient", "SearchResult"]
@@ -0,0 +1,297 @@
+"""
+Asyncio Vector Database Client
+
+Async sibling of VectorDBClient built on grpc.aio. Concurrent searches
+from asyncio callers run as coroutines over the same pooled channels
+instead of being wrapped in thread pools. Proto (de)serialization still
+holds the GIL, so CPU-bound workloads benefit from the multi-channel
+pool just like the sync client.
+"""
+
+import asyncio
+import itertools
+from typing import Dict, List, Optional, Tuple
+
+import grpc
+
+from .client import (_assign_vector, _extend_floats, _result_vector,
+                     _load_pb, _CHANNEL_OPTIONS)
+from .types import SearchResult, Vector
+
+# Generated proto modules, populated by _load_pb() on first construction
+vector_pb2 = None
+vector_pb2_grpc = None
+
+
+class AsyncVectorDBClient:
+    """
+    Asyncio Vector Database Client
+
+    Example:
+        >>> async with AsyncVectorDBClient("localhost:50051") as client:
+        ...     await client.insert("default", [0.1, 0.2, 0.3])
+        ...     results = await client.search("default", [0.1, 0.2, 0.3], k=10)
+    """
+
+    def __init__(self, address: str = "localhost:50051", use_tls: bool = False,
+                 cert_file: Optional[str] = None, pool_size: int = 4,
+                 compression: Optional[grpc.Compression] = grpc.Compression.Gzip):
+        """
+        Initialize async Vector Database client
+
+        Args:
+            address: Server address (host:port)
+            use_tls: Whether to use TLS encryption
+            cert_file: Path to TLS certificate file (if use_tls=True)
+            pool_size: Number of pooled grpc.aio channels (see VectorDBClient)
+            compression: gRPC compression for payload-heavy RPCs
+        """
+        global vector_pb2, vector_pb2_grpc
+        vector_pb2, vector_pb2_grpc = _load_pb()
+
+        self.address = address
+        self._pool_size = pool_size
+        self._compression = compression
+
+        if use_tls:
+            if cert_file:
+                with open(cert_file, 'rb') as f:
+                    credentials = grpc.ssl_channel_credentials(f.read())
+            else:
+                credentials = grpc.ssl_channel_credentials()
+            self._channels = [
+                grpc.aio.secure_channel(address, credentials,
+                                        options=_CHANNEL_OPTIONS,
+                                        compression=compression)
+                for _ in range(pool_size)
+            ]
+        else:
+            self._channels = [
+                grpc.aio.insecure_channel(address, options=_CHANNEL_OPTIONS,
+                                          compression=compression)
+                for _ in range(pool_size)
+            ]
+
+        self._stubs = [vector_pb2_grpc.VectorDBStub(channel) for channel in self._channels]
+        self._counter = itertools.count()
+
+    def _stub(self) -> "vector_pb2_grpc.VectorDBStub":
+        """Pick the next stub from the pool in round-robin order"""
+        return self._stubs[next(self._counter) % self._pool_size]
+
+    async def close(self):
+        """Close all gRPC channels in the pool"""
+        for channel in self._channels:
+            await channel.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def insert(self, namespace: str, vector: Vector,
+                     metadata: Optional[Dict[str, str]] = None,
+                     text: Optional[str] = None,
+                     id: Optional[str] = None,
+                     normalize: bool = False) -> str:
+        """Insert a single vector (see VectorDBClient.insert)"""
+        request = vector_pb2.InsertRequest(namespace=namespace)
+        if metadata:
+            request.metadata.update(metadata)
+        if text is not None:
+            request.text = text
+        if id is not None:
+            request.id = id
+        if normalize:
+            from . import distance
+            vector = distance.normalize(vector)
+        _assign_vector(request, vector)
+
+        response = await self._stub().Insert(request)
+
+        if not response.success:
+            raise Exception(f"Insert failed: {response.error}")
+
+        return response.id
+
+    async def search(self, namespace: str, query_vector: Vector, k: int = 10,
+                     ef_search: int = 50,
+                     filter_dict: Optional[Dict] = None,
+                     distance_metric: str = "cosine",
+                     include_vectors: bool = False,
+                     normalize: bool = False) -> List[SearchResult]:
+        """Search for K nearest neighbors (see VectorDBClient.search)"""
+        request = vector_pb2.SearchRequest(
+            namespace=namespace,
+            k=k,
+            ef_search=ef_search,
+            distance_metric=distance_metric
+        )
+        if normalize:
+            from . import distance
+            query_vector = distance.normalize(query_vector)
+        _assign_vector(request, query_vector, field="query_vector")
+
+        response = await self._stub().Search(request,
+                                             compression=self._compression)
+
+        if response.error:
+            raise Exception(f"Search failed: {response.error}")
+
+        return [
+            SearchResult(
+                id=r.id,
+                distance=r.distance,
+                vector=_result_vector(r) if include_vectors else None,
+                metadata=dict(r.metadata) if r.metadata else None,
+                text=r.text if r.text else None
+            )
+            for r in response.results
+        ]
+
+    async def hybrid_search(self, namespace: str, query_vector: Vector,
+                            query_text: str, k: int = 10,
+                            ef_search: int = 50,
+                            fusion_method: str = "rrf",
+                            vector_weight: float = 0.7,
+                            text_weight: float = 0.3,
+                            include_vectors: bool = False) -> List[SearchResult]:
+        """Hybrid vector + full-text search (see VectorDBClient.hybrid_search)"""
+        config = vector_pb2.HybridSearchConfig(
+            fusion_method=fusion_method,
+            vector_weight=vector_weight,
+            text_weight=text_weight,
+            rrf_k=60
+        )
+
+        request = vector_pb2.HybridSearchRequest(
+            namespace=namespace,
+            query_text=query_text,
+            k=k,
+            ef_search=ef_search,
+            config=config
+        )
+        _assign_vector(request, query_vector, field="query_vector")
+
+        response = await self._stub().HybridSearch(request,
+                                                   compression=self._compression)
+
+        if response.error:
+            raise Exception(f"Hybrid search failed: {response.error}")
+
+        return [
+            SearchResult(
+                id=r.id,
+                distance=r.distance,
+                vector=_result_vector(r) if include_vectors else None,
+                metadata=dict(r.metadata) if r.metadata else None,
+                text=r.text if r.text else None,
+                vector_score=r.vector_score if hasattr(r, 'vector_score') else None,
+                text_score=r.text_score if hasattr(r, 'text_score') else None
+            )
+            for r in response.results
+        ]
+
+    async def batch_insert(self, namespace: str,
+                           vectors: List[Tuple[Vector, Dict[str, str]]],
+                           *, shards: Optional[int] = None,
+                           normalize: bool = False) -> Dict:
+        """Insert multiple vectors efficiently (see VectorDBClient.batch_insert)"""
+        shards = shards or self._pool_size
+        shards = max(1, min(shards, len(vectors)))
+
+        if normalize:
+            from . import distance
+
+        async def request_generator(chunk):
+            for vector, metadata in chunk:
+                request = vector_pb2.InsertRequest(namespace=namespace)
+                if metadata:
+                    request.metadata.update(metadata)
+                if normalize:
+                    vector = distance.normalize(vector)
+                _assign_vector(request, vector)
+                yield request
+
+        async def run_shard(index, chunk):
+            return await self._stubs[index % self._pool_size].BatchInsert(
+                request_generator(chunk), compression=self._compression)
+
+        responses = await asyncio.gather(*[
+            run_shard(i, vectors[i::shards]) for i in range(shards)
+        ])
+
+        return {
+            "inserted_count": sum(r.inserted_count for r in responses),
+            "failed_count": sum(r.failed_count for r in responses),
+            "inserted_ids": [id for r in responses for id in r.inserted_ids],
+            "errors": [e for r in responses for e in r.errors],
+            "total_time_ms": max(r.total_time_ms for r in responses)
+        }
+
+    async def update(self, namespace: str, id: str,
+                     vector: Optional[Vector] = None,
+                     metadata: Optional[Dict[str, str]] = None,
+                     text: Optional[str] = None) -> bool:
+        """Update an existing vector (see VectorDBClient.update)"""
+        request = vector_pb2.UpdateRequest(namespace=namespace, id=id)
+        if vector is not None:
+            _extend_floats(request.vector, vector)
+        if metadata:
+            request.metadata.update(metadata)
+        if text is not None:
+            request.text = text
+
+        response = await self._stub().Update(request)
+
+        if not response.success:
+            raise Exception(f"Update failed: {response.error}")
+
+        return True
+
+    async def delete(self, namespace: str, id: str) -> int:
+        """Delete a vector by ID (see VectorDBClient.delete)"""
+        request = vector_pb2.DeleteRequest(
+            namespace=namespace,
+            id=id
+        )
+
+        response = await self._stub().Delete(request)
+
+        if not response.success:
+            raise Exception(f"Delete failed: {response.error}")
+
+        return response.deleted_count
+
+    async def get_stats(self, namespace: Optional[str] = None) -> Dict:
+        """Get database statistics (see VectorDBClient.get_stats)"""
+        request = vector_pb2.StatsRequest(namespace=namespace)
+        response = await self._stub().GetStats(request,
+                                               compression=self._compression)
+
+        return {
+            "total_vectors": response.total_vectors,
+            "total_namespaces": response.total_namespaces,
+            "memory_usage_bytes": response.memory_usage_bytes,
+            "namespace_stats": {
+                ns: {
+                    "vector_count": stats.vector_count,
+                    "memory_bytes": stats.memory_bytes,
+                    "dimensions": stats.dimensions
+                }
+                for ns, stats in response.namespace_stats.items()
+            }
+        }
+
+    async def health_check(self) -> Dict:
+        """Check server health (see VectorDBClient.health_check)"""
+        request = vector_pb2.HealthCheckRequest()
+        response = await self._stub().HealthCheck(request)
+
+        return {
+            "status": response.status,
+            "version": response.version,
+            "uptime_seconds": response.uptime_seconds,
+            "details": dict(response.details)
+        }
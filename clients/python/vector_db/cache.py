@@ -0,0 +1,104 @@
+"""
+Similarity-aware LRU cache for search results.
+
+Interactive and agent workloads re-issue near-identical queries within
+seconds. Instead of exact-match keys, lookups find the nearest cached
+query by dot product over unit-normalized vectors and treat it as a hit
+when its cosine distance is within a threshold, skipping the gRPC round
+trip and the server-side graph search entirely.
+"""
+
+import threading
+from dataclasses import replace
+from typing import Hashable, List, Optional
+
+import numpy as np
+
+from . import distance
+
+
+def _copy_results(results: List) -> List:
+    """
+    Copy result objects and their mutable fields.
+
+    Cached entries are handed to multiple callers over their lifetime;
+    without copies, one caller mutating a result's metadata (or vector)
+    would silently corrupt every later hit — and the entry a caller just
+    stored would alias the list it got back from search().
+    """
+    copied = []
+    for result in results:
+        vector = result.vector
+        if vector is not None:
+            vector = (vector.copy() if isinstance(vector, np.ndarray)
+                      else list(vector))
+        metadata = dict(result.metadata) if result.metadata else None
+        copied.append(replace(result, vector=vector, metadata=metadata))
+    return copied
+
+
+class SimilarityCache:
+    """
+    Bounded LRU cache keyed by query-vector similarity.
+
+    Entries live in per-bucket LRU lists (the client buckets by
+    namespace and search options, so results from different namespaces
+    never mix). A lookup is an approximate hit when the nearest cached
+    query is within `threshold` cosine distance and its entry holds at
+    least the requested k results. Keys are unit-normalized, so the
+    client only routes cosine-metric searches here — for magnitude-
+    sensitive metrics, q and 100*q would collide despite having
+    different neighbors.
+    """
+
+    def __init__(self, capacity: int = 1024, threshold: float = 0.05):
+        self.capacity = capacity
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        # bucket -> ([normalized query vectors], [result lists]), both in
+        # most-recently-used-first order
+        self._buckets = {}
+
+    def get(self, bucket: Hashable, query_vector, k: int) -> Optional[List]:
+        """Return cached results for the nearest stored query, or None"""
+        query = distance.normalize(query_vector)
+        with self._lock:
+            entry = self._buckets.get(bucket)
+            if not entry:
+                return None
+            keys, values = entry
+            sims = np.stack(keys) @ query
+            nearest = int(np.argmax(sims))
+            if 1.0 - float(sims[nearest]) > self.threshold:
+                return None
+            if len(values[nearest]) < k:
+                return None
+            # Move-to-front keeps eviction order LRU
+            keys.insert(0, keys.pop(nearest))
+            values.insert(0, values.pop(nearest))
+            return _copy_results(values[0][:k])
+
+    def put(self, bucket: Hashable, query_vector, results: List):
+        """Insert results at the front of the bucket, evicting the LRU tail"""
+        query = distance.normalize(query_vector)
+        with self._lock:
+            keys, values = self._buckets.setdefault(bucket, ([], []))
+            keys.insert(0, query)
+            values.insert(0, _copy_results(results))
+            if len(keys) > self.capacity:
+                keys.pop()
+                values.pop()
+
+    def invalidate(self, namespace: Optional[str] = None):
+        """
+        Drop cached results, either for one namespace or entirely.
+
+        The client calls this on writes so a cache hit never returns
+        results older than the caller's own mutations.
+        """
+        with self._lock:
+            if namespace is None:
+                self._buckets.clear()
+            else:
+                for bucket in [b for b in self._buckets if b[0] == namespace]:
+                    del self._buckets[bucket]
@@ -5,33 +5,111 @@ Main client for interacting with the Vector Database gRPC API.
 """
 
 import grpc
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from array import array
 import sys
 import os
 
-# Add proto path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'pkg', 'api', 'grpc', 'proto'))
-
 try:
-    import vector_pb2
-    import vector_pb2_grpc
+    import numpy as np
 except ImportError:
-    print("Error: gRPC proto files not found. Please generate them first:")
-    print("  cd pkg/api/grpc/proto && python -m grpc_tools.protoc -I. --python_out=. --grpc_python_out=. vector.proto")
-    raise
+    np = None
+
+from . import _fastproto
+from .types import SearchResult, Vector
+
+if np is not None:
+    from .cache import SimilarityCache
+
+# Generated proto modules, loaded lazily by _load_pb(). Importing them
+# builds the vector.proto descriptors, which dominates package import
+# time, so it is deferred until a client is actually constructed.
+vector_pb2 = None
+vector_pb2_grpc = None
+
+
+def _load_pb():
+    """Import the generated proto modules on first use and cache them"""
+    global vector_pb2, vector_pb2_grpc
+    if vector_pb2 is not None:
+        return vector_pb2, vector_pb2_grpc
+
+    # Add proto path for imports
+    proto_dir = os.path.join(os.path.dirname(__file__), '..', '..', '..',
+                             'pkg', 'api', 'grpc', 'proto')
+    if proto_dir not in sys.path:
+        sys.path.append(proto_dir)
+
+    try:
+        import vector_pb2 as pb2
+        import vector_pb2_grpc as pb2_grpc
+    except ImportError:
+        print("Error: gRPC proto files not found. Please generate them first:")
+        print("  cd pkg/api/grpc/proto && python -m grpc_tools.protoc -I. --python_out=. --grpc_python_out=. vector.proto")
+        raise
+
+    vector_pb2, vector_pb2_grpc = pb2, pb2_grpc
+    return vector_pb2, vector_pb2_grpc
+
+
+# RPC methods bound once per stub at construction; methods missing from
+# stale generated stubs are simply absent from the handle table
+_RPC_METHODS = (
+    "Insert", "Search", "HybridSearch", "BatchInsert",
+    "Update", "Delete", "GetStats", "HealthCheck",
+)
+
+# Options applied to every pooled channel (sync and asyncio clients).
+# Each channel gets its own TCP connection instead of the process-global
+# subchannel pool — otherwise the pool would collapse onto one connection.
+# The 4 MB default message cap is raised (large-k SearchResponses with
+# vectors exceed it), keepalive pings stop NATs from dropping idle pool
+# channels, and BDP probing grows HTTP/2 windows to vector-sized payloads.
+_CHANNEL_OPTIONS = [
+    ("grpc.use_local_subchannel_pool", 1),
+    ("grpc.max_receive_message_length", 256 * 1024 * 1024),
+    ("grpc.max_send_message_length", 256 * 1024 * 1024),
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.bdp_probe", 1),
+]
+
+def _extend_floats(container, vector):
+    """
+    Extend a repeated float field from a vector.
+
+    numpy arrays are copied into an array('f') as one float32 memcpy;
+    lists are converted through array('f') in one C loop. Either way the
+    protobuf runtime extends from a buffer-backed sequence instead of
+    boxing each element on its slow per-item path, and the wire encoding
+    is float32 regardless, so the round-trip values are identical.
+    """
+    if np is not None and isinstance(vector, np.ndarray):
+        buf = array('f')
+        buf.frombytes(vector.astype(np.float32, copy=False).tobytes())
+        vector = buf
+    elif not isinstance(vector, array):
+        vector = array('f', vector)
+    container.extend(vector)
+
 
+def _assign_vector(request, vector, field: str = "vector"):
+    """Copy a vector into a request message's repeated-float field"""
+    _extend_floats(getattr(request, field), vector)
 
-@dataclass
-class SearchResult:
-    """Search result with ID, distance, and optional vector/metadata"""
-    id: str
-    distance: float
-    vector: Optional[List[float]] = None
-    metadata: Optional[Dict[str, str]] = None
-    text: Optional[str] = None
-    vector_score: Optional[float] = None
-    text_score: Optional[float] = None
+
+def _result_vector(result) -> Optional[Vector]:
+    """Decode a SearchResult vector as float32 (numpy when available)"""
+    if not result.vector:
+        return None
+    if np is not None:
+        return np.array(result.vector, dtype=np.float32)
+    return list(result.vector)
 
 
 class VectorDBClient:
@@ -55,7 +133,9 @@ class VectorDBClient:
     """
 
     def __init__(self, address: str = "localhost:50051", use_tls: bool = False,
-                 cert_file: Optional[str] = None):
+                 cert_file: Optional[str] = None, pool_size: int = 4,
+                 compression: Optional[grpc.Compression] = grpc.Compression.Gzip,
+                 cache_size: int = 0, cache_threshold: float = 0.05):
         """
         Initialize Vector Database client
 
@@ -63,8 +143,36 @@ class VectorDBClient:
             address: Server address (host:port)
             use_tls: Whether to use TLS encryption
             cert_file: Path to TLS certificate file (if use_tls=True)
+            pool_size: Number of gRPC channels in the connection pool.
+                Each channel is a separate HTTP/2 connection, so concurrent
+                callers avoid head-of-line blocking on a single connection.
+            compression: gRPC compression for payload-heavy RPCs
+                (search results and batch inserts). Defaults to gzip, which
+                pays off for remote servers; pass
+                grpc.Compression.NoCompression for localhost.
+            cache_size: Capacity of the client-side similarity cache for
+                cosine-metric search() calls (other metrics are never
+                cached). Disabled by default (0); pass a positive size
+                to opt in. Queries within cache_threshold cosine distance
+                of a recent query reuse its results without a server round
+                trip. Writes through this client invalidate the affected
+                namespace, but writes from other clients stay invisible
+                until eviction, so only enable it when approximate, maybe-
+                stale results are acceptable.
+            cache_threshold: Maximum cosine distance for a cache hit.
         """
+        _load_pb()
+
         self.address = address
+        self._pool_size = pool_size
+        self._compression = compression
+
+        if cache_size > 0 and np is not None:
+            self._cache = SimilarityCache(cache_size, cache_threshold)
+        else:
+            self._cache = None
+
+        options = _CHANNEL_OPTIONS
 
         if use_tls:
             if cert_file:
@@ -72,15 +180,62 @@ class VectorDBClient:
                     credentials = grpc.ssl_channel_credentials(f.read())
             else:
                 credentials = grpc.ssl_channel_credentials()
-            self.channel = grpc.secure_channel(address, credentials)
+            self._channels = [
+                grpc.secure_channel(address, credentials, options=options,
+                                    compression=compression)
+                for _ in range(pool_size)
+            ]
         else:
-            self.channel = grpc.insecure_channel(address)
+            self._channels = [
+                grpc.insecure_channel(address, options=options,
+                                      compression=compression)
+                for _ in range(pool_size)
+            ]
+
+        self._stubs = [vector_pb2_grpc.VectorDBStub(channel) for channel in self._channels]
+        # Bind every RPC's callable per stub once; hot-path calls index
+        # this table instead of doing attribute lookup on the stub
+        self._calls = {
+            name: [getattr(stub, name) for stub in self._stubs]
+            for name in _RPC_METHODS if hasattr(self._stubs[0], name)
+        }
+        # Raw BatchInsert handles taking pre-encoded request bytes from
+        # _fastproto, skipping pb2 message construction on the hot path
+        self._batch_insert_raw = [
+            channel.stream_unary(
+                '/vector.VectorDB/BatchInsert',
+                request_serializer=None,
+                response_deserializer=vector_pb2.BatchInsertResponse.FromString,
+            )
+            for channel in self._channels
+        ]
+        self._counter = itertools.count()
+        self._tls = threading.local()
 
-        self.stub = vector_pb2_grpc.VectorDBStub(self.channel)
+    def _call(self, name: str):
+        """Pick the next pooled handle for an RPC in round-robin order"""
+        return self._calls[name][next(self._counter) % self._pool_size]
+
+    def _scratch(self, name: str, factory):
+        """
+        Per-thread reusable request message, cleared before each use.
+
+        Rebuilding a message per call pays per-field setter and descriptor
+        costs; reusing one template per thread keeps hot loops (ingestion,
+        query fan-out) off the allocator without sharing state across
+        threads.
+        """
+        message = getattr(self._tls, name, None)
+        if message is None:
+            message = factory()
+            setattr(self._tls, name, message)
+        message.Clear()
+        return message
 
     def close(self):
-        """Close the gRPC channel"""
-        self.channel.close()
+        """Close all gRPC channels in the pool"""
+        for channel in self._channels:
+            channel.close()
 
     def __enter__(self):
         return self
@@ -88,19 +243,25 @@ class VectorDBClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
-    def insert(self, namespace: str, vector: List[float],
+    def insert(self, namespace: str, vector: Vector,
                metadata: Optional[Dict[str, str]] = None,
                text: Optional[str] = None,
-               id: Optional[str] = None) -> str:
+               id: Optional[str] = None,
+               normalize: bool = False) -> str:
         """
         Insert a single vector
 
         Args:
             namespace: Namespace for multi-tenancy
-            vector: Vector embedding (list of floats)
+            vector: Vector embedding (list of floats or float32 numpy array)
             metadata: Optional metadata key-value pairs
             text: Optional text content for full-text search
             id: Optional custom ID (auto-generated if not provided)
+            normalize: Scale the vector to unit L2 norm before sending.
+                With every stored vector and query normalized, cosine
+                similarity reduces to a single dot product — pass
+                normalize=True on search() too, or normalize queries with
+                vector_db.distance.normalize()
 
         Returns:
             ID of inserted vector
@@ -112,25 +273,35 @@ class VectorDBClient:
             ...     metadata={"category": "tech", "title": "Vector DB"}
             ... )
         """
-        request = vector_pb2.InsertRequest(
-            namespace=namespace,
-            vector=vector,
-            metadata=metadata or {},
-            text=text,
-            id=id
-        )
-
-        response = self.stub.Insert(request)
+        request = self._scratch('insert_request', vector_pb2.InsertRequest)
+        request.namespace = namespace
+        if metadata:
+            request.metadata.update(metadata)
+        if text is not None:
+            request.text = text
+        if id is not None:
+            request.id = id
+        if normalize:
+            from . import distance
+            vector = distance.normalize(vector)
+        _assign_vector(request, vector)
+
+        response = self._call('Insert')(request)
 
         if not response.success:
             raise Exception(f"Insert failed: {response.error}")
 
+        if self._cache is not None:
+            self._cache.invalidate(namespace)
+
         return response.id
 
-    def search(self, namespace: str, query_vector: List[float], k: int = 10,
+    def search(self, namespace: str, query_vector: Vector, k: int = 10,
                ef_search: int = 50,
                filter_dict: Optional[Dict] = None,
-               distance_metric: str = "cosine") -> List[SearchResult]:
+               distance_metric: str = "cosine",
+               include_vectors: bool = False,
+               normalize: bool = False) -> List[SearchResult]:
         """
         Search for K nearest neighbors
 
@@ -141,6 +312,11 @@ class VectorDBClient:
             ef_search: HNSW ef_search parameter (accuracy vs speed)
             filter_dict: Optional metadata filter
             distance_metric: "cosine", "euclidean", or "dot_product"
+            include_vectors: Copy result vectors into SearchResult.vector.
+                Off by default — decoding k full vectors costs O(k*dim)
+                Python float allocations that most callers never read.
+            normalize: Scale the query to unit L2 norm before sending
+                (pair with normalize=True inserts, see insert())
 
         Returns:
             List of SearchResult objects
@@ -155,38 +331,56 @@ class VectorDBClient:
             >>> for result in results:
             ...     print(f"ID: {result.id}, Distance: {result.distance}")
         """
-        request = vector_pb2.SearchRequest(
-            namespace=namespace,
-            query_vector=query_vector,
-            k=k,
-            ef_search=ef_search,
-            distance_metric=distance_metric
-        )
+        # Cache keys are unit-normalized, which erases query magnitude;
+        # only cosine results are magnitude-invariant, so other metrics
+        # bypass the cache rather than serve q's neighbors for 100*q.
+        use_cache = self._cache is not None and distance_metric == "cosine"
+        cache_bucket = (namespace, include_vectors, ef_search, normalize)
+        if use_cache:
+            cached = self._cache.get(cache_bucket, query_vector, k)
+            if cached is not None:
+                return cached
+
+        request = self._scratch('search_request', vector_pb2.SearchRequest)
+        request.namespace = namespace
+        request.k = k
+        request.ef_search = ef_search
+        request.distance_metric = distance_metric
+        if normalize:
+            from . import distance
+            query_vector = distance.normalize(query_vector)
+        _assign_vector(request, query_vector, field="query_vector")
 
         # TODO: Add filter support
 
-        response = self.stub.Search(request)
+        response = self._call('Search')(request, compression=self._compression)
 
         if response.error:
             raise Exception(f"Search failed: {response.error}")
 
-        return [
+        results = [
             SearchResult(
                 id=r.id,
                 distance=r.distance,
-                vector=list(r.vector) if r.vector else None,
+                vector=_result_vector(r) if include_vectors else None,
                 metadata=dict(r.metadata) if r.metadata else None,
                 text=r.text if r.text else None
             )
             for r in response.results
         ]
 
-    def hybrid_search(self, namespace: str, query_vector: List[float],
+        if use_cache:
+            self._cache.put(cache_bucket, query_vector, results)
+
+        return results
+
+    def hybrid_search(self, namespace: str, query_vector: Vector,
                      query_text: str, k: int = 10,
                      ef_search: int = 50,
                      fusion_method: str = "rrf",
                      vector_weight: float = 0.7,
-                     text_weight: float = 0.3) -> List[SearchResult]:
+                     text_weight: float = 0.3,
+                     include_vectors: bool = False) -> List[SearchResult]:
         """
         Hybrid search combining vector similarity and full-text search
 
@@ -199,6 +393,8 @@ class VectorDBClient:
             fusion_method: "rrf" or "weighted"
             vector_weight: Weight for vector results (0.0-1.0)
             text_weight: Weight for text results (0.0-1.0)
+            include_vectors: Copy result vectors into SearchResult.vector
+                (off by default, see search())
 
         Returns:
             List of SearchResult objects
@@ -220,14 +416,14 @@ class VectorDBClient:
 
         request = vector_pb2.HybridSearchRequest(
             namespace=namespace,
-            query_vector=query_vector,
             query_text=query_text,
             k=k,
             ef_search=ef_search,
             config=config
         )
+        _assign_vector(request, query_vector, field="query_vector")
 
-        response = self.stub.HybridSearch(request)
+        response = self._call('HybridSearch')(request, compression=self._compression)
 
         if response.error:
             raise Exception(f"Hybrid search failed: {response.error}")
@@ -236,7 +432,7 @@ class VectorDBClient:
             SearchResult(
                 id=r.id,
                 distance=r.distance,
-                vector=list(r.vector) if r.vector else None,
+                vector=_result_vector(r) if include_vectors else None,
                 metadata=dict(r.metadata) if r.metadata else None,
                 text=r.text if r.text else None,
                 vector_score=r.vector_score if hasattr(r, 'vector_score') else None,
@@ -245,13 +441,84 @@ class VectorDBClient:
             for r in response.results
         ]
 
-    def batch_insert(self, namespace: str, vectors: List[Tuple[List[float], Dict[str, str]]]) -> Dict:
+    def rerank(self, query_vector: Vector, results: List[SearchResult],
+               k: Optional[int] = None,
+               distance_metric: str = "cosine") -> List[SearchResult]:
+        """
+        Re-rank search results locally against the query vector
+
+        Recomputes exact distances with the kernels in vector_db.distance
+        (numba-JITted when numba is installed) and sorts — no server
+        round-trip. Results must carry their vectors, i.e. come from a
+        search with include_vectors=True.
+
+        Args:
+            query_vector: Query vector embedding
+            results: SearchResult list to re-rank
+            k: Number of results to keep (all if not specified)
+            distance_metric: "cosine" or "euclidean"
+
+        Returns:
+            Re-ranked SearchResult list with recomputed distances
+
+        Example:
+            >>> results = client.search("default", query, k=100,
+            ...                         include_vectors=True)
+            >>> top = client.rerank(query, results, k=10)
+        """
+        from . import distance
+
+        candidates = [r for r in results if r.vector is not None]
+        if not candidates:
+            return []
+
+        matrix = distance.as_float32_matrix([r.vector for r in candidates])
+        query = distance.as_float32_vector(query_vector)
+
+        if distance_metric == "cosine":
+            distances = distance.cosine_matrix(matrix, query)
+        elif distance_metric == "euclidean":
+            distances = distance.sq_euclid_matrix(matrix, query)
+        else:
+            raise ValueError(f"Unsupported rerank metric: {distance_metric}")
+
+        order = np.argsort(distances)
+        if k is not None:
+            order = order[:k]
+
+        return [
+            SearchResult(
+                id=candidates[i].id,
+                distance=float(distances[i]),
+                vector=candidates[i].vector,
+                metadata=candidates[i].metadata,
+                text=candidates[i].text,
+                vector_score=candidates[i].vector_score,
+                text_score=candidates[i].text_score
+            )
+            for i in order
+        ]
+
+    def batch_insert(self, namespace: str, vectors: List[Tuple[Vector, Dict[str, str]]],
+                     *, shards: Optional[int] = None,
+                     normalize: bool = False) -> Dict:
         """
         Insert multiple vectors efficiently
 
+        The batch is sharded across the channel pool and streamed over
+        `shards` parallel RPCs, so bulk loads are not serialized onto a
+        single HTTP/2 connection. Each stream builds requests on demand
+        as gRPC pulls from the generator, so in-flight memory stays
+        bounded by HTTP/2 flow control rather than batch size.
+
         Args:
             namespace: Namespace for vectors
-            vectors: List of (vector, metadata) tuples
+            vectors: List of (vector, metadata) tuples; vectors may be
+                float lists or float32 numpy arrays
+            shards: Number of parallel BatchInsert streams
+                (defaults to pool_size)
+            normalize: Scale each vector to unit L2 norm before sending
+                (see insert())
 
         Returns:
             Dictionary with inserted_count, failed_count, and inserted_ids
@@ -264,26 +531,48 @@ class VectorDBClient:
             >>> result = client.batch_insert("default", vectors)
             >>> print(f"Inserted {result['inserted_count']} vectors")
         """
-        def request_generator():
-            for vector, metadata in vectors:
-                yield vector_pb2.InsertRequest(
-                    namespace=namespace,
-                    vector=vector,
-                    metadata=metadata
-                )
+        shards = shards or self._pool_size
+        shards = max(1, min(shards, len(vectors)))
+
+        if normalize:
+            from . import distance
+
+        namespace_bytes = namespace.encode('utf-8')
+
+        def request_generator(chunk):
+            for vector, metadata in chunk:
+                if normalize:
+                    vector = distance.normalize(vector)
+                yield _fastproto.encode_insert_request(
+                    namespace_bytes, vector, metadata)
+
+        def run_shard(index, chunk):
+            return self._batch_insert_raw[index % self._pool_size](
+                request_generator(chunk), compression=self._compression)
+
+        if shards == 1:
+            responses = [run_shard(next(self._counter), vectors)]
+        else:
+            with ThreadPoolExecutor(max_workers=shards) as executor:
+                futures = [
+                    executor.submit(run_shard, i, vectors[i::shards])
+                    for i in range(shards)
+                ]
+                responses = [future.result() for future in futures]
 
-        response = self.stub.BatchInsert(request_generator())
+        if self._cache is not None:
+            self._cache.invalidate(namespace)
 
         return {
-            "inserted_count": response.inserted_count,
-            "failed_count": response.failed_count,
-            "inserted_ids": list(response.inserted_ids),
-            "errors": list(response.errors),
-            "total_time_ms": response.total_time_ms
+            "inserted_count": sum(r.inserted_count for r in responses),
+            "failed_count": sum(r.failed_count for r in responses),
+            "inserted_ids": [id for r in responses for id in r.inserted_ids],
+            "errors": [e for r in responses for e in r.errors],
+            "total_time_ms": max(r.total_time_ms for r in responses)
         }
 
     def update(self, namespace: str, id: str,
-               vector: Optional[List[float]] = None,
+               vector: Optional[Vector] = None,
                metadata: Optional[Dict[str, str]] = None,
                text: Optional[str] = None) -> bool:
         """
@@ -299,19 +588,24 @@ class VectorDBClient:
         Returns:
             True if successful
         """
-        request = vector_pb2.UpdateRequest(
-            namespace=namespace,
-            id=id,
-            vector=vector or [],
-            metadata=metadata or {},
-            text=text
-        )
-
-        response = self.stub.Update(request)
+        request = self._scratch('update_request', vector_pb2.UpdateRequest)
+        request.namespace = namespace
+        request.id = id
+        if vector is not None:
+            _extend_floats(request.vector, vector)
+        if metadata:
+            request.metadata.update(metadata)
+        if text is not None:
+            request.text = text
+
+        response = self._call('Update')(request)
 
         if not response.success:
             raise Exception(f"Update failed: {response.error}")
 
+        if self._cache is not None:
+            self._cache.invalidate(namespace)
+
         return True
 
     def delete(self, namespace: str, id: str) -> int:
@@ -325,16 +619,18 @@ class VectorDBClient:
         Returns:
             Number of vectors deleted
         """
-        request = vector_pb2.DeleteRequest(
-            namespace=namespace,
-            id=id
-        )
+        request = self._scratch('delete_request', vector_pb2.DeleteRequest)
+        request.namespace = namespace
+        request.id = id
 
-        response = self.stub.Delete(request)
+        response = self._call('Delete')(request)
 
         if not response.success:
             raise Exception(f"Delete failed: {response.error}")
 
+        if self._cache is not None:
+            self._cache.invalidate(namespace)
+
         return response.deleted_count
 
     def get_stats(self, namespace: Optional[str] = None) -> Dict:
@@ -348,7 +644,7 @@ class VectorDBClient:
             Dictionary with statistics
         """
         request = vector_pb2.StatsRequest(namespace=namespace)
-        response = self.stub.GetStats(request)
+        response = self._call('GetStats')(request, compression=self._compression)
 
         return {
             "total_vectors": response.total_vectors,
@@ -372,7 +668,7 @@ class VectorDBClient:
             Dictionary with health status
         """
         request = vector_pb2.HealthCheckRequest()
-        response = self.stub.HealthCheck(request)
+        response = self._call('HealthCheck')(request)
 
         return {
             "status": response.status,
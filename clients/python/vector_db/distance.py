@@ -0,0 +1,136 @@
+"""
+Local distance kernels for post-retrieval reranking.
+
+Search normally happens server-side, but users routinely re-rank or
+post-filter a returned candidate set locally. These kernels cover that
+path without pulling in SciPy: with numba installed they compile to
+LLVM-autovectorized loops (float32, contiguous arrays), otherwise they
+fall back to equivalent NumPy expressions.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Guards against division by zero on zero-length vectors
+_EPS = np.float32(1e-12)
+
+
+if njit is not None:
+
+    @njit('f4(f4[::1],f4[::1])', fastmath=True, cache=True)
+    def sq_euclid(x, y):
+        """Squared Euclidean distance between two float32 vectors"""
+        s = np.float32(0.0)
+        for i in range(x.shape[0]):
+            d = x[i] - y[i]
+            s += d * d
+        return s
+
+    @njit('f4(f4[::1],f4[::1])', fastmath=True, cache=True)
+    def dot(x, y):
+        """Dot product of two float32 vectors"""
+        s = np.float32(0.0)
+        for i in range(x.shape[0]):
+            s += x[i] * y[i]
+        return s
+
+    @njit('f4(f4[::1],f4[::1])', fastmath=True, cache=True)
+    def cosine(x, y):
+        """Cosine distance (1 - similarity) between two float32 vectors"""
+        dot = np.float32(0.0)
+        xn = np.float32(0.0)
+        yn = np.float32(0.0)
+        for i in range(x.shape[0]):
+            dot += x[i] * y[i]
+            xn += x[i] * x[i]
+            yn += y[i] * y[i]
+        return np.float32(1.0) - dot / (np.sqrt(xn) * np.sqrt(yn) + _EPS)
+
+    @njit('f4[::1](f4[:,::1],f4[::1])', fastmath=True, parallel=True,
+          cache=True)
+    def cosine_matrix(matrix, query):
+        """Cosine distance from `query` to every row of `matrix`"""
+        n = matrix.shape[0]
+        dim = matrix.shape[1]
+        out = np.empty(n, dtype=np.float32)
+        qn = np.float32(0.0)
+        for i in range(dim):
+            qn += query[i] * query[i]
+        qn = np.sqrt(qn)
+        for row in prange(n):
+            dot = np.float32(0.0)
+            rn = np.float32(0.0)
+            for i in range(dim):
+                dot += matrix[row, i] * query[i]
+                rn += matrix[row, i] * matrix[row, i]
+            out[row] = np.float32(1.0) - dot / (np.sqrt(rn) * qn + _EPS)
+        return out
+
+    @njit('f4[::1](f4[:,::1],f4[::1])', fastmath=True, parallel=True,
+          cache=True)
+    def sq_euclid_matrix(matrix, query):
+        """Squared Euclidean distance from `query` to every row of `matrix`"""
+        n = matrix.shape[0]
+        dim = matrix.shape[1]
+        out = np.empty(n, dtype=np.float32)
+        for row in prange(n):
+            s = np.float32(0.0)
+            for i in range(dim):
+                d = matrix[row, i] - query[i]
+                s += d * d
+            out[row] = s
+        return out
+
+else:
+
+    def sq_euclid(x, y):
+        """Squared Euclidean distance between two float32 vectors"""
+        d = x - y
+        return np.float32(np.dot(d, d))
+
+    def dot(x, y):
+        """Dot product of two float32 vectors"""
+        return np.float32(np.dot(x, y))
+
+    def cosine(x, y):
+        """Cosine distance (1 - similarity) between two float32 vectors"""
+        return np.float32(
+            1.0 - np.dot(x, y)
+            / (np.linalg.norm(x) * np.linalg.norm(y) + _EPS))
+
+    def cosine_matrix(matrix, query):
+        """Cosine distance from `query` to every row of `matrix`"""
+        sims = matrix @ query
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+        return (np.float32(1.0) - sims / (norms + _EPS)).astype(np.float32)
+
+    def sq_euclid_matrix(matrix, query):
+        """Squared Euclidean distance from `query` to every row of `matrix`"""
+        diff = matrix - query
+        return np.einsum('ij,ij->i', diff, diff).astype(np.float32)
+
+
+def normalize(vector) -> np.ndarray:
+    """
+    Scale a vector to unit L2 norm (float32 copy).
+
+    On unit vectors cosine similarity collapses to a plain dot product —
+    ``1 - dot(a, b)`` — so normalizing once at insert removes the
+    per-distance norm work (~3x fewer FLOPs) from every later comparison.
+    """
+    v = np.asarray(vector, dtype=np.float32)
+    return v / (np.linalg.norm(v) + _EPS)
+
+
+def as_float32_matrix(vectors) -> np.ndarray:
+    """Stack vectors into the contiguous float32 matrix the kernels expect"""
+    return np.ascontiguousarray(vectors, dtype=np.float32)
+
+
+def as_float32_vector(vector) -> np.ndarray:
+    """Convert a vector into the contiguous float32 form the kernels expect"""
+    return np.ascontiguousarray(vector, dtype=np.float32)
@@ -0,0 +1,32 @@
+"""
+Client-facing result and vector types.
+
+Kept apart from client.py so `from vector_db import SearchResult` does
+not trigger the generated proto import — building descriptors for
+vector.proto is the expensive part of importing the package, and
+callers that only want the plain types (or short-lived CLIs that may
+never open a connection) should not pay for it.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Vectors are accepted either as plain float lists or as numpy arrays
+Vector = Union[List[float], "np.ndarray"]
+
+
+@dataclass
+class SearchResult:
+    """Search result with ID, distance, and optional vector/metadata"""
+    id: str
+    distance: float
+    vector: Optional[Vector] = None
+    metadata: Optional[Dict[str, str]] = None
+    text: Optional[str] = None
+    vector_score: Optional[float] = None
+    text_score: Optional[float] = None
@@ -381,6 +381,11 @@ func (s *Server) Update(ctx context.Context, req *proto.UpdateRequest) (*proto.U
 }
 
 // BatchInsert implements the BatchInsert streaming RPC
+//
+// TODO: add a dictionary-encoded variant (BatchInsertColumnar) that
+// sends the namespace and metadata keys once per stream instead of per
+// request. Needs a proto change plus protoc regeneration of the Go and
+// Python stubs before the handler can be written.
 func (s *Server) BatchInsert(stream proto.VectorDB_BatchInsertServer) error {
 	start := time.Now()
 	var insertedCount, failedCount int32
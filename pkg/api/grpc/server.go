@@ -15,6 +15,7 @@ import (
 	"github.com/therealutkarshpriyadarshi/vector/pkg/search"
 	"google.golang.org/grpc"
 	"google.golang.org/grpc/credentials"
+	_ "google.golang.org/grpc/encoding/gzip" // register gzip (de)compressor for compressed clients
 	"google.golang.org/grpc/keepalive"
 	"google.golang.org/grpc/reflection"
 )
@@ -157,6 +158,16 @@ func (s *Server) Start() error {
 	}
 	opts = append(opts, grpc.KeepaliveParams(kaParams))
 
+	// Allow client keepalive pings. The Python client pings every 30s,
+	// including on idle pooled channels; without this policy the server
+	// enforces the gRPC defaults (one ping per 5 minutes, streams only)
+	// and answers with a "too_many_pings" GOAWAY.
+	kaPolicy := keepalive.EnforcementPolicy{
+		MinTime:             10 * time.Second,
+		PermitWithoutStream: true,
+	}
+	opts = append(opts, grpc.KeepaliveEnforcementPolicy(kaPolicy))
+
 	// Configure max connections
 	opts = append(opts, grpc.MaxConcurrentStreams(uint32(s.config.Server.MaxConnections)))
 